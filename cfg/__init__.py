@@ -1 +1 @@
-from cfg.get_config import get_config
+from cfg.get_config import clear_caches, get_config, get_configs
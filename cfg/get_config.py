@@ -7,37 +7,41 @@ The actual source and its priority can be defined by the user.
 
 Functions:
     - get_config: The main function to fetch configuration values.
+    - get_configs: Fetch several configuration values at once.
+    - clear_caches: Forget all parsed config files and directory listings.
 
 Exceptions:
     - ConfigItemNotFound: Raised when the desired configuration is not found in any of the sources.
 """
 
+import copy
+import errno
+import functools
 import os
+import re
+import stat
+import sys
+import threading
+from enum import IntEnum
 from pathlib import Path
-from typing import Literal, TypeVar, Protocol, Mapping, Any
+from typing import Literal, Protocol, Mapping, Any, Iterable
 
-import dotenv
-import toml
 
+__all__ = ["DEFAULT_HOME", "clear_caches", "get_config", "get_configs"]
 
-__all__ = ["DEFAULT_HOME", "get_config"]
-
-from rusty_results import Result, Ok, Err
+from rusty_results import Result, Err  # type: ignore[import-untyped]
 
 DEFAULT_HOME = Path.home()
+_DEFAULT_HOME: str = os.fspath(DEFAULT_HOME)
 
-T = TypeVar("T")
-E = TypeVar("E")
+# Parsed config files, keyed by path. Each entry remembers the mtime and size of the file at the time it was parsed so
+# that a modified file is read again.
+_PARSED_CACHE: dict[str, tuple[int, int, Mapping[str, Any]]] = {}
+_PARSED_CACHE_LOCK = threading.Lock()
 
-
-class MakeFileNameFunction(Protocol):
-    """
-    Protocol to define a function that creates a file name where the config item should be located given the
-    application name, the configuration section and the item name.
-    """
-
-    def __call__(self, application: str, section: str, item: str) -> str:
-        ...
+# Names of the regular files in the directories searched for config files, keyed by directory path. Each entry
+# remembers the mtime of the directory so that adding or removing a file is noticed.
+_DIR_LISTING_CACHE: dict[str, tuple[int, frozenset[str]]] = {}
 
 
 class ReadConfigFileFunction(Protocol):
@@ -56,8 +60,8 @@ class GetConfigFunction(Protocol):
     """
 
     def __call__(
-        self, application: str, section: str, item: str, home: str | None
-    ) -> Result[Any, Exception]:
+        self, application: str, section: str, item: str, home: str, /
+    ) -> tuple[bool, Any]:
         ...
 
 
@@ -73,52 +77,254 @@ class ConfigItemNotFound(Exception):
         super().__init__(message)
 
 
+def _disk_cache_path(path: str) -> str:
+    """
+    Return where the on-disk cache keeps the parsed contents of a config file.
+
+    :param path: Path to the config file.
+    :return: A path inside '$XDG_CACHE_HOME/cfg', defaulting to '~/.cache/cfg'.
+    """
+    import hashlib
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        _DEFAULT_HOME, ".cache"
+    )
+    key = hashlib.blake2b(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_home, "cfg", key)
+
+
+def _is_private_dir(path: str) -> bool:
+    """
+    Tell whether a directory is owned by the current user and inaccessible to anyone else.
+
+    Unpickling can run arbitrary code, so the on-disk cache is only used inside such a directory. Platforms without
+    POSIX ownership never qualify.
+
+    :param path: Path to the directory.
+    :return: True if the directory can be trusted.
+    """
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and stat.S_IMODE(st.st_mode) & 0o077 == 0
+    )
+
+
+def _write_disk_cache(
+    cache_path: str, entry: tuple[int, int, Mapping[str, Any]]
+) -> None:
+    """
+    Atomically replace an entry of the on-disk cache.
+
+    :param cache_path: Path to the cache entry.
+    :param entry: The mtime and size of the config file, and its parsed contents.
+    """
+    import pickle
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            pickle.dump(entry, tmp, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_disk_cached(
+    path: str, st: os.stat_result, read_config_file: ReadConfigFileFunction
+) -> Mapping[str, Any]:
+    """
+    Read a config file through the on-disk cache.
+
+    The cached contents are used if they were parsed from a file with the same mtime and size as `st`. Otherwise the
+    file is parsed by `read_config_file` and the cache entry is replaced. The cache is ignored unless its directory is
+    private to the current user (see `_is_private_dir`). Failing to read or write the cache is not an error; the file
+    is then simply parsed.
+
+    :param path: Path to the config file.
+    :param st: The result of `os.stat` on the config file.
+    :param read_config_file: A function that parses the file into a mapping.
+    :return: The parsed contents of the file.
+    """
+    import pickle
+
+    cache_path = _disk_cache_path(path)
+    cache_dir = os.path.dirname(cache_path)
+    if _is_private_dir(cache_dir):
+        try:
+            with open(cache_path, "rb") as fh:
+                cached: tuple[int, int, Mapping[str, Any]] = pickle.load(fh)
+            if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+        except Exception:
+            pass
+
+    data = read_config_file(path)
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if _is_private_dir(cache_dir):
+            _write_disk_cache(cache_path, (st.st_mtime_ns, st.st_size, data))
+    except Exception:
+        pass
+    return data
+
+
+def _read_cached(
+    path: str, read_config_file: ReadConfigFileFunction
+) -> Mapping[str, Any]:
+    """
+    Read a config file through the parsed-file cache.
+
+    The file is only parsed by `read_config_file` if it has not been seen before or if its mtime or size changed since
+    it was last parsed. If the CFG_DISK_CACHE environment variable is set to 1, parsed files are also cached on disk so
+    that they survive the process.
+
+    :param path: Path to the config file.
+    :param read_config_file: A function that parses the file into a mapping.
+    :return: The parsed contents of the file.
+    """
+    st = os.stat(path)
+    cached = _PARSED_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    if os.environ.get("CFG_DISK_CACHE") == "1":
+        data = _read_disk_cached(path, st, read_config_file)
+    else:
+        data = read_config_file(path)
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _list_dir(path: str) -> frozenset[str]:
+    """
+    List the names of the regular files in a directory through the directory listing cache.
+
+    The directory is only scanned again if its mtime changed since it was last scanned. A missing directory is reported
+    as empty. Membership in the result thus stands in for an `os.path.isfile` check on each candidate file.
+
+    :param path: Path to the directory.
+    :return: The names of the regular files in the directory.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return frozenset()
+
+    cached = _DIR_LISTING_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with os.scandir(path) as it:
+            names = frozenset(entry.name for entry in it if entry.is_file())
+    except OSError:
+        names = frozenset()
+    _DIR_LISTING_CACHE[path] = (mtime, names)
+    return names
+
+
+@functools.lru_cache(maxsize=256)
+def _config_directories(cwd: str, home: str, application: str) -> tuple[str, str]:
+    """
+    Return the local and global directories holding the config files of an application, in search order.
+
+    :param cwd: The current working directory.
+    :param home: The base directory for global configurations.
+    :param application: The name of the application.
+    :return: The 'config/<application>' subdirectories of `cwd` and `home`.
+    """
+    return (
+        os.path.join(cwd, "config", application),
+        os.path.join(home, "config", application),
+    )
+
+
 def __find_in_files(
     application: str,
-    section: str,
     item: str,
     home: str,
-    make_file_name: MakeFileNameFunction,
+    file_names: list[str],
     read_config_file: ReadConfigFileFunction,
-) -> Result[Any, Exception]:
+) -> tuple[bool, Any]:
     """
-    Search for configuration data in local and global directories based on the provided application, section, and
-    item names.
+    Search for configuration data in local and global directories based on the provided application and item names.
 
     This function looks in two directories for a configuration file:
     - The 'config' subdirectory of the current working directory.
     - The 'config' subdirectory of the provided `home` directory.
 
-    The exact file name and its sub-path within these directories are determined by the `make_file_name` function.
+    Each directory is searched once, trying every name in `file_names` in order, within the application's
+    subdirectory. The first file that contains the item wins.
 
     :param application: The name of the application for which the configuration is sought.
-    :param section: The section within the application's configuration to look into. Can be None.
     :param item: The specific object or key within the section to retrieve.
     :param home: The base directory for global configurations.
-    :param make_file_name: A function that, given the application, section, and object, produces the desired file name.
-    :return: If the object is found, returns a Result with 'ok' and the corresponding data. If not, or if any exceptions
-             occur, returns a Result with 'error' and a list of exceptions.
+    :param file_names: The names of the candidate files, in order of preference.
+    :param read_config_file: A function that reads a file into a mapping.
+    :return: If the object is found, returns `(True, value)` with the corresponding data. If not, or if any exceptions
+             occur, returns `(False, errors)` with a list of exceptions.
     """
-    directories = [os.path.join(os.getcwd(), "config"), os.path.join(home, "config")]
+    errors: list[Exception] = []
+
+    for directory in _config_directories(os.getcwd(), home, application):
+        names = _list_dir(directory)
+        for file_name in file_names:
+            full_path = os.path.join(directory, file_name)
+            if file_name not in names:
+                message = os.strerror(errno.ENOENT)
+                error = FileNotFoundError(errno.ENOENT, message, full_path)
+                errors.append(error)
+                continue
+            try:
+                data = read_config_file(full_path)
+            except Exception as e:
+                errors.append(e)
+                continue
+            if item in data:
+                return True, data[item]
 
-    file_name = make_file_name(application, section, item)
-    errors = []
+    return False, errors
 
-    for directory in directories:
-        full_path = os.path.join(directory, application, file_name)
-        try:
-            data = read_config_file(full_path)
-            if item in data:
-                return Ok(data[item])
-        except Exception as e:
-            errors.append(Result.error(e))
 
-    return Err(errors)
+def _parse_toml(path: str) -> dict[str, Any]:
+    """
+    Read a TOML file into a dict.
+
+    :param path: Path to the TOML file.
+    :return: The contents of the file.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
+    with open(path, "rb") as fh:
+        return tomllib.load(fh)
+
+
+def _read_toml(path: str) -> Mapping[str, Any]:
+    """
+    Read a TOML file through the parsed-file cache.
+
+    :param path: Path to the TOML file.
+    :return: The contents of the file.
+    """
+    return _read_cached(path, _parse_toml)
 
 
 def __get_config_from_toml(
     application: str, section: str, item: str, home: str
-) -> Result[Any, Exception]:
+) -> tuple[bool, Any]:
     """
     Fetch configuration data from a TOML file.
 
@@ -131,33 +337,147 @@ def __get_config_from_toml(
     :param home: Home directory to search for global configurations.
     :return: The configuration value if found or an error.
     """
-
-    def make_file_name(_app: str, sec: str, _obj: str) -> str:
-        return f"{sec}.toml"
-
-    def read_config_file(file_name: str) -> Mapping[str, Any]:
-        with open(file_name, encoding="utf-8") as fh:
-            data = toml.load(fh)
-            return data
-
     return __find_in_files(
         application,
-        section,
         item,
         home,
-        make_file_name=make_file_name,
-        read_config_file=read_config_file,
+        file_names=[f"{section}.toml"],
+        read_config_file=_read_toml,
     )
 
 
+# Escape sequences understood inside single- and double-quoted dotenv values.
+_DOTENV_ESCAPES: Mapping[str, Mapping[str, str]] = {
+    "'": {"\\": "\\", "'": "'"},
+    '"': {
+        "\\": "\\",
+        "'": "'",
+        '"': '"',
+        "a": "\a",
+        "b": "\b",
+        "f": "\f",
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+        "v": "\v",
+    },
+}
+
+_DOTENV_INLINE_COMMENT = re.compile(r"\s+#.*")
+
+# What may follow the closing quote of a quoted dotenv value on its line.
+_DOTENV_TRAILER = re.compile(r"[^\S\n]*(?:#.*)?")
+
+# Leading whitespace, which may span blank lines, and an optional 'export' prefix of a dotenv line.
+_DOTENV_EXPORT = re.compile(r"\s*(?:export[^\S\n]+)?")
+
+# A dotenv key and the blanks after it. Keys are either single-quoted, possibly spanning several lines, or made of
+# characters other than '=', '#' and whitespace, not starting with a quote.
+_DOTENV_KEY = re.compile(r"(?:'([^']+)'|([^'=#\s][^=#\s]*))[^\S\n]*")
+
+
+def _scan_dotenv_quoted(text: str, start: int) -> tuple[str, int] | None:
+    """
+    Scan a quoted dotenv value, which may span several lines.
+
+    Backslash escapes are decoded as listed in `_DOTENV_ESCAPES`; other backslashes are kept as they are.
+
+    :param text: The contents of the dotenv file.
+    :param start: The position of the opening quote in `text`.
+    :return: The decoded value and the position of the closing quote, or None if the quote is never closed.
+    """
+    quote = text[start]
+    escapes = _DOTENV_ESCAPES[quote]
+    chars = []
+    i = start + 1
+    while i < len(text):
+        char = text[i]
+        if char == "\\" and text[i + 1 : i + 2] in escapes:
+            chars.append(escapes[text[i + 1]])
+            i += 2
+        elif char == quote:
+            return "".join(chars), i
+        else:
+            chars.append(char)
+            i += 1
+    return None
+
+
+def _parse_dotenv(path: str) -> dict[str, str | None]:
+    """
+    Read a dotenv file into a dict.
+
+    Each non-empty line that does not start with '#' is a `KEY=value` pair, optionally prefixed with 'export'. Keys
+    may be single-quoted; unquoted keys cannot contain '=', '#' or whitespace. A key without '=' maps to None, and a
+    line without a valid key is skipped. Quoted values may contain escaped quotes and span several lines; a value whose
+    quote is never closed or is followed by anything but a comment is skipped. Unquoted values end at a '#' preceded by
+    whitespace. Variable expansion is not supported.
+
+    :param path: Path to the dotenv file.
+    :return: The keys and values defined in the file.
+    """
+    with open(path, encoding="utf-8") as fh:
+        text = fh.read()
+
+    values: dict[str, str | None] = {}
+    pos = 0
+    while pos < len(text):
+        export = _DOTENV_EXPORT.match(text, pos)
+        assert export is not None  # The pattern matches the empty string.
+        match = _DOTENV_KEY.match(text, export.end())
+        # A line without a valid key is skipped. Since a quoted key may span several lines, the line of a valid key
+        # ends after the key.
+        rest = pos if match is None else match.end()
+        end = text.find("\n", rest)
+        if end == -1:
+            end = len(text)
+        next_pos = end + 1
+
+        if match is not None:
+            key = match[1] if match[1] is not None else match[2]
+            if text.startswith("=", rest, end):
+                value = text[rest + 1 : end]
+                quote = value.lstrip()[:1]
+                if quote in _DOTENV_ESCAPES:
+                    # Scan `text` itself, since the value may continue past this line.
+                    start = text.index(quote, rest + 1)
+                    scanned = _scan_dotenv_quoted(text, start)
+                    if scanned is not None:
+                        quoted, close = scanned
+                        end = text.find("\n", close)
+                        if end == -1:
+                            end = len(text)
+                        next_pos = end + 1
+                        if _DOTENV_TRAILER.fullmatch(text, close + 1, end):
+                            values[key] = quoted
+                else:
+                    values[key] = _DOTENV_INLINE_COMMENT.sub("", value).strip()
+            elif rest == end or text[rest] == "#":
+                values[key] = None
+
+        pos = next_pos
+    return values
+
+
+def _read_dotenv(path: str) -> Mapping[str, Any]:
+    """
+    Read a dotenv file through the parsed-file cache.
+
+    :param path: Path to the dotenv file.
+    :return: The contents of the file.
+    """
+    return _read_cached(path, _parse_dotenv)
+
+
 def __get_config_from_dotenv(
     application: str, section: str, item: str, home: str
-) -> Result[Any, Exception]:
+) -> tuple[bool, Any]:
     """
     Fetch configuration data from a dotenv file.
 
     This function retrieves the specified item from a dotenv file, given the application and section.
-    The search prioritizes the local directory over the global home directory.
+    The search prioritizes the local directory over the global home directory. Within each directory, the
+    section-specific '.env.<section>' file is tried before the generic '.env' file.
 
     :param application: Name of the application.
     :param section: Section of the configuration.
@@ -165,38 +485,31 @@ def __get_config_from_dotenv(
     :param home: Home directory to search for global configurations.
     :return: The configuration value if found or an error.
     """
-
-    def make_file_name(_app: str, sec: str, _obj: str) -> str:
-        return f".env.{sec}"
-
-    def read_config_file(file_name: str) -> Mapping[str, Any]:
-        return dotenv.dotenv_values(file_name)
-
-    attempt_1 = __find_in_files(
+    return __find_in_files(
         application,
-        section,
         item,
         home,
-        make_file_name=make_file_name,
-        read_config_file=read_config_file,
+        file_names=[f".env.{section}", ".env"],
+        read_config_file=_read_dotenv,
     )
 
-    if attempt_1.is_ok():
-        return attempt_1
-    else:
-        return __find_in_files(
-            application,
-            section,
-            item,
-            home,
-            make_file_name=lambda _app, _sec, _obj: ".env",
-            read_config_file=read_config_file,
-        )
+
+@functools.lru_cache(maxsize=1024)
+def _env_var_name(application: str, section: str, item: str) -> str:
+    """
+    Build the name of the environment variable holding a configuration item.
+
+    :param application: Name of the application.
+    :param section: Section of the configuration.
+    :param item: Specific configuration item.
+    :return: The application, section and item in uppercase, separated by underscores.
+    """
+    return f"{application.upper()}_{section.upper()}_{item.upper()}"
 
 
 def __get_config_from_env(
     application: str, section: str, item: str, _home: str
-) -> Result[Any, Exception]:
+) -> tuple[bool, Any]:
     """
     Fetch configuration data from an environment variable.
 
@@ -208,20 +521,57 @@ def __get_config_from_env(
     :param item: Specific configuration item to fetch.
     :return: The configuration value if found or an error.
     """
-    env_variable_name = f"{application.upper()}_{section.upper()}_{item.upper()}"
     try:
-        return Ok(os.environ[env_variable_name])
-    except Exception as e:
-        return Err([e])
+        return True, os.environ[_env_var_name(application, section, item)]
+    except KeyError as e:
+        return False, [e]
+
+
+class _Source(IntEnum):
+    """The configuration sources, used as indices into the tables below."""
+
+    ENV = 0
+    DOTENV = 1
+    TOML = 2
+
+
+# Maps the public names used in `priority` to sources.
+_SOURCE_BY_NAME: Mapping[str, _Source] = {
+    "env variable": _Source.ENV,
+    ".env file": _Source.DOTENV,
+    "config file": _Source.TOML,
+}
+
+_DEFAULT_PRIORITY: tuple[_Source, ...] = (_Source.ENV, _Source.DOTENV, _Source.TOML)
+
+_DISPATCH_TABLE: tuple[GetConfigFunction, ...] = (
+    __get_config_from_env,
+    __get_config_from_dotenv,
+    __get_config_from_toml,
+)
+
+# File names, relative to config/<application>, that each source may read.
+_SOURCE_FILE_NAMES: tuple[tuple[str, ...], ...] = (
+    (),
+    (".env.{section}", ".env"),
+    ("{section}.toml",),
+)
+
+# Functions reading the files of each source through the parsed-file cache.
+_SOURCE_READERS: tuple[ReadConfigFileFunction | None, ...] = (
+    None,
+    _read_dotenv,
+    _read_toml,
+)
 
 
 def get_config(
     item: str,
     section: str = "DEFAULT",
     application: str = "DEFAULT",
-    home: str = DEFAULT_HOME,
+    home: str = _DEFAULT_HOME,
     priority: list[Literal["config file", ".env file", "env variable"]] | None = None,
-):
+) -> Any:
     """
     Fetch a configuration item.
 
@@ -237,20 +587,93 @@ def get_config(
     :raise ConfigItemNotFound: If the configuration item is not found in any of the sources.
     """
 
-    if not priority:
-        priority = ["env variable", ".env file", "config file"]
+    if not priority or priority[0] == "env variable":
+        env_value = os.environ.get(_env_var_name(application, section, item))
+        if env_value is not None:
+            return env_value
 
-    dispatch: Mapping[str, GetConfigFunction] = {
-        "env variable": __get_config_from_env,
-        ".env file": __get_config_from_dotenv,
-        "config file": __get_config_from_toml,
-    }
+    if priority:
+        sources = tuple(_SOURCE_BY_NAME[p] for p in priority)
+    else:
+        sources = _DEFAULT_PRIORITY
+    errors: list[Exception] = []
+
+    for p in sources:
+        fn = _DISPATCH_TABLE[p]
+        ok, value = fn(application, section, item, home)
+        if ok:
+            # Parsed files are cached, so hand out copies of TOML tables and arrays that callers may modify.
+            if isinstance(value, (dict, list)):
+                return copy.deepcopy(value)
+            return value
+        errors.extend(value)
+
+    raise ConfigItemNotFound(Err(errors))
+
+
+def get_configs(
+    items: Iterable[tuple[str, str]],
+    application: str = "DEFAULT",
+    home: str = _DEFAULT_HOME,
+    priority: list[Literal["config file", ".env file", "env variable"]] | None = None,
+    max_workers: int = 4,
+) -> list[Any]:
+    """
+    Fetch several configuration items at once.
+
+    Every config file that may hold one of the items is parsed at most once, with the files read concurrently by a
+    thread pool. Each item is then resolved as by `get_config`.
 
-    for p in priority:
-        fn = dispatch[p]
-        result = fn(application, section, item, home)
-        match result:
-            case Ok(value):
-                return value
-            case Err(_):
-                raise ConfigItemNotFound(result)
+    :param items: The `(item, section)` pairs to fetch.
+    :param application: The application name for which the configuration is sought (default to 'DEFAULT').
+    :param home: Base directory for global configurations (default to the user's home directory).
+    :param priority: A list indicating the priority of sources. If not provided, a default priority is used.
+    :param max_workers: The maximum number of threads reading config files.
+    :return: The configuration values, in the order of `items`.
+    :raise ConfigItemNotFound: If one of the configuration items is not found in any of the sources.
+    """
+    items = list(items)
+    if priority:
+        sources = tuple(_SOURCE_BY_NAME[p] for p in priority)
+    else:
+        sources = _DEFAULT_PRIORITY
+    file_sources = [source for source in sources if source is not _Source.ENV]
+
+    sections = {
+        section
+        for item, section in items
+        if sources[0] is not _Source.ENV
+        or _env_var_name(application, section, item) not in os.environ
+    }
+    files: dict[str, ReadConfigFileFunction] = {}
+    for directory in _config_directories(os.getcwd(), home, application):
+        names = _list_dir(directory)
+        for section in sections:
+            for source in file_sources:
+                for name in _SOURCE_FILE_NAMES[source]:
+                    file_name = name.format(section=section)
+                    read = _SOURCE_READERS[source]
+                    if file_name in names and read is not None:
+                        files[os.path.join(directory, file_name)] = read
+
+    if files:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(read, path) for path, read in files.items()]
+            for future in futures:
+                # Parse errors are reported by get_config below.
+                future.exception()
+
+    return [
+        get_config(item, section, application, home, priority)
+        for item, section in items
+    ]
+
+
+def clear_caches() -> None:
+    """
+    Forget all parsed config files and directory listings.
+    """
+    _PARSED_CACHE.clear()
+    _DIR_LISTING_CACHE.clear()
@@ -2,6 +2,6 @@ from cfg import get_config
 
 
 def test_dummy(monkeypatch):
-    monkeypatch.setenv("FOO", "BAR")
+    monkeypatch.setenv("DEFAULT_DEFAULT_FOO", "BAR")
     foo = get_config("FOO")
     assert foo == "BAR"
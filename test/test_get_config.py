@@ -0,0 +1,203 @@
+import collections
+import os
+import pickle
+import sys
+
+import pytest
+
+from cfg import clear_caches, get_config, get_configs
+from cfg.get_config import ConfigItemNotFound, _disk_cache_path, _parse_dotenv
+
+# `cfg.get_config` is shadowed by the function of the same name, so fetch the module itself for monkeypatching.
+get_config_module = sys.modules["cfg.get_config"]
+
+
+@pytest.fixture
+def config_dir(monkeypatch, tmp_path):
+    """The local config directory of the application 'app', found from the current working directory."""
+    path = tmp_path / "config" / "app"
+    path.mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    return path
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    """The directory of the on-disk cache, which is switched on."""
+    monkeypatch.setenv("CFG_DISK_CACHE", "1")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache" / "cfg"
+
+
+def test_falls_back_to_next_source(monkeypatch, tmp_path, config_dir):
+    (config_dir / "section.toml").write_text('foo = "from toml"\n')
+    monkeypatch.delenv("APP_SECTION_FOO", raising=False)
+
+    assert get_config("foo", "section", "app", home=str(tmp_path)) == "from toml"
+
+
+def test_reports_missing_files(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ConfigItemNotFound) as exc_info:
+        get_config("foo", "section", "app", home=str(tmp_path / "home"))
+    missing = tmp_path / "config" / "app" / "section.toml"
+    assert f"No such file or directory: '{missing}'" in str(exc_info.value)
+
+
+def test_picks_up_changed_file(config_dir):
+    config_file = config_dir / "section.toml"
+    config_file.write_text('foo = "old"\n')
+
+    assert get_config("foo", "section", "app", priority=["config file"]) == "old"
+    config_file.write_text('foo = "newer"\n')
+    assert get_config("foo", "section", "app", priority=["config file"]) == "newer"
+
+
+def test_returns_copies_of_tables(config_dir):
+    (config_dir / "section.toml").write_text('[db]\nuser = "u"\npassword = "p"\n')
+
+    def lookup(*priority):
+        return get_config("db", "section", "app", priority=list(priority))
+
+    lookup("config file").pop("password")
+    expected = {"user": "u", "password": "p"}
+    assert lookup("config file") == expected
+    assert lookup(".env file", "config file") == expected
+
+
+def test_reads_dotenv_file(config_dir):
+    (config_dir / ".env").write_text(
+        "# comment\n"
+        "export PLAIN = value  # trailing comment\n"
+        "SINGLE='a # b'\n"
+        'DOUBLE="line\\nbreak"\n'
+    )
+
+    def lookup(item):
+        return get_config(item, "section", "app", priority=[".env file"])
+
+    assert lookup("PLAIN") == "value"
+    assert lookup("SINGLE") == "a # b"
+    assert lookup("DOUBLE") == "line\nbreak"
+
+
+def test_reads_dotenv_edge_cases(tmp_path):
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text(
+        "SINGLE='it\\'s'\n"
+        'DOUBLE="a\\\'b"\n'
+        "TAB=val\t#tab\n"
+        'MULTI="multi\nline"\n'
+        "'QUOTED'=key\n"
+        "=empty key\n"
+        "A B=invalid key\n"
+        "JUNK='value' junk\n"
+        "export =no key\n"
+        "EMPTY= # comment\n"
+        "BROKEN='unterminated\n"
+        "AFTER=ok\n"
+    )
+
+    assert _parse_dotenv(str(dotenv_file)) == {
+        "SINGLE": "it's",
+        "DOUBLE": "a'b",
+        "TAB": "val",
+        "MULTI": "multi\nline",
+        "QUOTED": "key",
+        "EMPTY": "",
+        "AFTER": "ok",
+    }
+
+
+def test_local_dotenv_beats_global_section_dotenv(monkeypatch, tmp_path):
+    local_dir = tmp_path / "work" / "config" / "app"
+    local_dir.mkdir(parents=True)
+    (local_dir / ".env").write_text("FOO=local\n")
+    global_dir = tmp_path / "home" / "config" / "app"
+    global_dir.mkdir(parents=True)
+    (global_dir / ".env.section").write_text("FOO=global\n")
+    monkeypatch.chdir(tmp_path / "work")
+
+    home = str(tmp_path / "home")
+    assert get_config("FOO", "section", "app", home, [".env file"]) == "local"
+
+
+def test_get_configs(monkeypatch, tmp_path, config_dir):
+    (config_dir / "first.toml").write_text('foo = "one"\nbar = "two"\n')
+    (config_dir / ".env.second").write_text("BAZ=three\nQUUX=five\n")
+    monkeypatch.setenv("APP_SECOND_QUX", "four")
+    parsed = collections.Counter()
+
+    def counting(parse):
+        def count_and_parse(path):
+            parsed[os.path.basename(path)] += 1
+            return parse(path)
+
+        return count_and_parse
+
+    for name in ("_parse_toml", "_parse_dotenv"):
+        parse = getattr(get_config_module, name)
+        monkeypatch.setattr(get_config_module, name, counting(parse))
+
+    items = [
+        ("foo", "first"),
+        ("bar", "first"),
+        ("BAZ", "second"),
+        ("QUUX", "second"),
+        ("QUX", "second"),
+    ]
+    expected = ["one", "two", "three", "five", "four"]
+    assert get_configs(items, "app", home=str(tmp_path)) == expected
+    assert parsed == {"first.toml": 1, ".env.second": 1}
+
+
+def test_disk_cache(monkeypatch, config_dir, cache_dir):
+    (config_dir / "section.toml").write_text('foo = "cached"\n')
+
+    assert get_config("foo", "section", "app", priority=["config file"]) == "cached"
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail(_path):
+        raise AssertionError("config file parsed again")
+
+    clear_caches()
+    monkeypatch.setattr(get_config_module, "_parse_toml", fail)
+    assert get_config("foo", "section", "app", priority=["config file"]) == "cached"
+
+
+_unpickled = []
+
+
+def _mark_unpickled():
+    _unpickled.append(True)
+
+
+class _Planted:
+    def __reduce__(self):
+        return _mark_unpickled, ()
+
+
+def test_disk_cache_ignores_shared_directory(config_dir, cache_dir):
+    (config_dir / "section.toml").write_text('foo = "from file"\n')
+    cache_dir.mkdir(parents=True)
+    cache_dir.chmod(0o777)
+
+    planted = _disk_cache_path(str(config_dir / "section.toml"))
+    with open(planted, "wb") as fh:
+        pickle.dump(_Planted(), fh)
+
+    assert get_config("foo", "section", "app", priority=["config file"]) == "from file"
+    assert _unpickled == []
+    assert [p.name for p in cache_dir.iterdir()] == [os.path.basename(planted)]
+
+
+def test_disk_cache_cleans_up_failed_writes(monkeypatch, config_dir, cache_dir):
+    (config_dir / "section.toml").write_text('foo = "from file"\n')
+
+    def fail(*_args):
+        raise pickle.PicklingError("cannot pickle")
+
+    monkeypatch.setattr(pickle, "dump", fail)
+    assert get_config("foo", "section", "app", priority=["config file"]) == "from file"
+    assert list(cache_dir.iterdir()) == []